@@ -0,0 +1,9 @@
+"""
+Benchmarks do servidor de inventário.
+
+Gera uma frota sintética de máquinas (relatórios no formato do agente) e
+eventos do rsyslog, sobe o app localmente (SQLite ou o MySQL do
+docker-compose.yaml) ou usa um servidor já em execução, dispara clientes
+concorrentes contra as rotas principais e compara o resultado com uma
+baseline salva. Uso: `python -m benchmarks --help`.
+"""
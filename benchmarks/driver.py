@@ -0,0 +1,135 @@
+"""
+Execução concorrente dos cenários de carga e cálculo das estatísticas.
+"""
+import math
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+METRIC_LINE = re.compile(r'^(?P<name>[a-z_]+)\{endpoint="(?P<endpoint>[^"]+)"\} (?P<value>[0-9.e+-]+)$')
+
+
+def percentile(values, fraction):
+    """
+    Percentil pelo método nearest-rank (valores em qualquer ordem).
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def scrape_statement_counts(base_url):
+    """
+    Lê de /metrics o total de comandos SQL e de requisições por endpoint
+    (histograma http_request_sql_statements).
+
+    Returns:
+        dict: endpoint -> (comandos, requisições); vazio se /metrics não responder.
+    """
+    try:
+        text = requests.get(f'{base_url}/metrics', timeout=10).text
+    except requests.exceptions.RequestException:
+        return {}
+    sums, counts = {}, {}
+    for line in text.splitlines():
+        match = METRIC_LINE.match(line)
+        if not match:
+            continue
+        if match['name'] == 'http_request_sql_statements_sum':
+            sums[match['endpoint']] = float(match['value'])
+        elif match['name'] == 'http_request_sql_statements_count':
+            counts[match['endpoint']] = float(match['value'])
+    return {endpoint: (sums[endpoint], counts.get(endpoint, 0)) for endpoint in sums}
+
+
+def run_scenario(base_url, scenario, clients, total):
+    """
+    Executa `total` requisições de um cenário com `clients` clientes concorrentes.
+
+    Args:
+        base_url (str): URL do servidor.
+        scenario (dict): 'name', 'endpoint' (nome da rota no Flask, para as
+            métricas) e 'request' (função índice -> (método, caminho, kwargs)).
+        clients (int): Número de clientes simultâneos.
+        total (int): Número total de requisições.
+
+    Returns:
+        dict: Requisições, erros, duração, vazão, p50/p99 (ms) e comandos SQL por requisição.
+    """
+    local = threading.local()
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def worker(index):
+        if not hasattr(local, 'session'):
+            local.session = requests.Session()
+        method, path, kwargs = scenario['request'](index)
+        started = time.perf_counter()
+        try:
+            response = local.session.request(method, base_url + path, timeout=60, **kwargs)
+            failed = response.status_code >= 400
+        except requests.exceptions.RequestException:
+            failed = True
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            if failed:
+                errors.append(index)
+
+    before = scrape_statement_counts(base_url)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        list(executor.map(worker, range(total)))
+    duration = time.perf_counter() - started
+    after = scrape_statement_counts(base_url)
+
+    statements = None
+    endpoint = scenario['endpoint']
+    if endpoint in after:
+        old_sum, old_count = before.get(endpoint, (0, 0))
+        new_sum, new_count = after[endpoint]
+        if new_count > old_count:
+            statements = round((new_sum - old_sum) / (new_count - old_count), 2)
+
+    return {
+        'requests': total,
+        'errors': len(errors),
+        'seconds': round(duration, 3),
+        'throughput': round(total / duration, 1) if duration else None,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+        'statements_per_request': statements,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compara os resultados com uma baseline.
+
+    Um cenário regride se o p99 piorar ou a vazão cair mais que `tolerance`
+    (fração), ou se emitir mais comandos SQL por requisição.
+
+    Returns:
+        list: Descrições das regressões encontradas.
+    """
+    regressions = []
+    for name, old in baseline.get('scenarios', {}).items():
+        new = results['scenarios'].get(name)
+        if new is None:
+            continue
+        if new['p99_ms'] > old['p99_ms'] * (1 + tolerance):
+            regressions.append(f"{name}: p99 {old['p99_ms']} ms -> {new['p99_ms']} ms")
+        if old['throughput'] and new['throughput'] < old['throughput'] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {old['throughput']} -> {new['throughput']} req/s")
+        if (old.get('statements_per_request') is not None and new.get('statements_per_request') is not None
+                and new['statements_per_request'] > old['statements_per_request'] + 0.5):
+            regressions.append(f"{name}: SQL statements per request "
+                               f"{old['statements_per_request']} -> {new['statements_per_request']}")
+        if new['errors'] > old['errors']:
+            regressions.append(f"{name}: errors {old['errors']} -> {new['errors']}")
+    return regressions
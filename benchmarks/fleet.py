@@ -0,0 +1,118 @@
+"""
+Geração de relatórios sintéticos de agentes, no mesmo formato de
+`collect_system_info()` do utf-inventory-agent.py.
+"""
+import random
+import uuid
+from datetime import datetime, timedelta
+
+# Salas dos laboratórios (sufixo do hostname); o restante da frota é do DACOM
+ROOMS = ('e003', 'e006', 'e007', 'e100', 'e101', 'e102', 'e103', 'e104', 'e105')
+
+DISTRIBUTIONS = ('Ubuntu 22.04', 'Ubuntu 24.04', 'Linux Mint 21.3', 'Debian GNU/Linux 12')
+KERNELS = ('5.15.0-119-generic', '6.5.0-45-generic', '6.8.0-47-generic', '6.1.0-25-amd64')
+CPUS = ('Intel(R) Core(TM) i5-10400 CPU @ 2.90GHz', 'Intel(R) Core(TM) i7-12700 CPU @ 2.10GHz',
+        'AMD Ryzen 5 5600G with Radeon Graphics')
+BOARDS = ('H410M H V2', 'PRIME B560M-A', 'B450M DS3H')
+GPUS = ('NVIDIA GeForce GTX 1650', 'NVIDIA GeForce RTX 3060')
+
+
+def make_host(index, rng):
+    """
+    Cria os dados fixos de uma máquina da frota (nome, MAC e hardware).
+    """
+    room = rng.choice(ROOMS) if rng.random() < 0.8 else None
+    hostname = f'lab-{room}-{index:04d}' if room else f'dacom-pc-{index:04d}'
+    return {
+        'index': index,
+        'hostname': hostname,
+        'node': 0x020000000000 + index,
+        'linux_distribution': rng.choice(DISTRIBUTIONS),
+        'kernel_version': rng.choice(KERNELS),
+        'cpu_model': rng.choice(CPUS),
+        'memory_total_gb': rng.choice((7.64, 15.5, 31.2)),
+        'motherboard_model': rng.choice(BOARDS),
+        'gpu': rng.choice(GPUS) if rng.random() < 0.3 else None,
+        'users': [f'a{rng.randrange(2000000, 2999999)}' for _ in range(rng.randint(3, 40))],
+    }
+
+
+def make_report(host, rng, collected_at):
+    """
+    Gera um relatório completo de uma máquina, como enviado pelo agente.
+
+    Args:
+        host (dict): Máquina de `make_host`.
+        rng (random.Random): Gerador de números aleatórios (reprodutível).
+        collected_at (datetime): Data da coleta.
+
+    Returns:
+        dict: Relatório no formato de `collect_system_info()`.
+    """
+    mac = ':'.join(f'{(host["node"] >> shift) & 0xff:02x}' for shift in range(40, -8, -8))
+    sessions = []
+    for user in host['users']:
+        login = collected_at - timedelta(minutes=rng.randrange(5, 60 * 24 * 90))
+        logout = login + timedelta(minutes=rng.randrange(5, 300))
+        sessions.append({
+            'user': user,
+            'tty': rng.choice(('tty2', 'pts/0', 'pts/1', ':0')),
+            'ip': rng.choice(('', '10.0.3.%d' % rng.randrange(1, 254))),
+            'datetime': login.strftime('%Y-%m-%d %H:%M:%S'),
+            'logout': logout.strftime('%Y-%m-%d %H:%M:%S') if logout < collected_at else None,
+        })
+    disk_total = rng.choice((237.9, 475.9, 931.5))
+    disk_free = round(disk_total * rng.uniform(0.05, 0.9), 2)
+    filesystems = [
+        {'device': '/dev/nvme0n1p2', 'mountpoint': '/', 'fstype': 'ext4',
+         'total': disk_total, 'used': round(disk_total - disk_free, 2), 'free': disk_free},
+        {'device': '/dev/nvme0n1p1', 'mountpoint': '/boot/efi', 'fstype': 'vfat',
+         'total': 0.5, 'used': 0.01, 'free': 0.49},
+        {'device': 'nfs.dacom:/home', 'mountpoint': '/home/alunos', 'fstype': 'nfs4',
+         'total': 7450.0, 'used': round(rng.uniform(1000, 7000), 2), 'free': 450.0},
+    ]
+    gpus = []
+    if host['gpu']:
+        memory_used = rng.randrange(200, 3000)
+        gpus.append({'gpu_id': 0, 'name': host['gpu'], 'driver_version': '535.183.01',
+                     'memory_total': 4096.0, 'memory_free': 4096.0 - memory_used,
+                     'memory_used': float(memory_used), 'temperature': float(rng.randrange(35, 80))})
+    else:
+        gpus.append({'gpu_id': '00:02.0', 'name': 'VGA compatible controller: Intel Corporation UHD Graphics 630',
+                     'driver_version': '', 'memory_total': 0, 'memory_free': 0, 'memory_used': 0, 'temperature': 0})
+    return {
+        'hostname': host['hostname'],
+        'uuid1': str(uuid.uuid1(node=host['node'], clock_seq=rng.getrandbits(14))),
+        'collection_datetime': collected_at.strftime('%Y-%m-%d %H:%M:%S'),
+        'linux_distribution': host['linux_distribution'],
+        'kernel_version': host['kernel_version'],
+        'logged_in_user': rng.choice(host['users']),
+        'cpu_model': host['cpu_model'],
+        'memory_total_gb': host['memory_total_gb'],
+        'user_login_history': sessions,
+        'ip_and_mac_addresses': [
+            {'interface': 'enp3s0', 'ip': '10.0.%d.%d' % (host['index'] // 250 % 250, host['index'] % 250 + 1), 'mac': mac},
+            {'interface': 'docker0', 'ip': '172.17.0.1', 'mac': '02:42:%s' % mac[6:]},
+        ],
+        'mounted_filesystems': filesystems,
+        'disk_info': {'total': disk_total, 'free': disk_free},
+        'gpu_info': gpus,
+        'motherboard_model': host['motherboard_model'],
+    }
+
+
+def generate_fleet(count, seed=0):
+    """
+    Gera as máquinas de uma frota de `count` hosts (sempre a mesma para a mesma semente).
+    """
+    rng = random.Random(seed)
+    return [make_host(index, rng) for index in range(count)]
+
+
+def generate_reports(hosts, seed=0, collected_at=None):
+    """
+    Gera um relatório completo para cada máquina da frota.
+    """
+    rng = random.Random(seed)
+    collected_at = collected_at or datetime(2026, 10, 1, 8, 0, 0)
+    return [make_report(host, rng, collected_at) for host in hosts]
@@ -0,0 +1,72 @@
+"""
+Geração de eventos sintéticos do rsyslog (tabela SystemEvents).
+"""
+import random
+from datetime import datetime, timedelta
+
+TAGS = (
+    ('sshd[{pid}]:', 'Accepted publickey for {user} from 10.0.3.{octet} port {port} ssh2', 10, 6),
+    ('sshd[{pid}]:', 'pam_unix(sshd:session): session closed for user {user}', 10, 6),
+    ('systemd-logind[{pid}]:', 'New session {pid} of user {user}.', 4, 6),
+    ('sudo:', '{user} : TTY=pts/0 ; PWD=/home/{user} ; USER=root ; COMMAND=/usr/bin/apt update', 10, 5),
+    ('kernel:', 'nfs: server nfs.dacom not responding, still trying', 0, 4),
+    ('CRON[{pid}]:', '(root) CMD (test -x /etc/cron.daily/popularity-contest)', 9, 6),
+    ('gdm-password]:', 'pam_unix(gdm-password:auth): authentication failure; user={user}', 10, 5),
+)
+
+
+def generate_events(hostnames, count, seed=0, days=30, end=None):
+    """
+    Gera `count` eventos distribuídos entre os hosts ao longo de `days` dias,
+    em ordem crescente de ReceivedAt (como o rsyslog grava).
+
+    Yields:
+        dict: Colunas de uma linha de SystemEvents.
+    """
+    rng = random.Random(seed)
+    end = end or datetime(2026, 10, 1, 8, 0, 0)
+    start = end - timedelta(days=days)
+    step = (end - start) / max(count, 1)
+    # Alguns hosts falam muito mais que outros, como na frota real
+    weights = [rng.paretovariate(1.5) for _ in hostnames]
+    for index in range(count):
+        received_at = start + step * index
+        hostname = rng.choices(hostnames, weights)[0]
+        user = f'a{rng.randrange(2000000, 2999999)}'
+        tag, message, facility, priority = rng.choice(TAGS)
+        values = {'pid': rng.randrange(300, 60000), 'user': user, 'octet': rng.randrange(1, 254),
+                  'port': rng.randrange(30000, 60000)}
+        yield {
+            'ReceivedAt': received_at,
+            'DeviceReportedTime': received_at,
+            'Facility': facility,
+            'Priority': priority,
+            'FromHost': hostname,
+            'Message': ' ' + message.format(**values),
+            'SysLogTag': tag.format(**values),
+            'EventUser': user if '{user}' in message else None,
+            'InfoUnitID': 1,
+        }
+
+
+def insert_events(db, model, events, batch_size=5000):
+    """
+    Insere os eventos em lotes (executemany) no banco de logs.
+
+    Returns:
+        int: Número de eventos inseridos.
+    """
+    total = 0
+    batch = []
+    for event in events:
+        batch.append(event)
+        if len(batch) >= batch_size:
+            db.session.execute(db.insert(model), batch)
+            db.session.commit()
+            total += len(batch)
+            batch = []
+    if batch:
+        db.session.execute(db.insert(model), batch)
+        db.session.commit()
+        total += len(batch)
+    return total
@@ -34,4 +34,10 @@ CREATE TABLE SystemEventsProperties
         SystemEventID int NULL ,
         ParamName varchar(255) NULL ,
         ParamValue text NULL
-);
\ No newline at end of file
+);
+
+-- Índices usados pelas consultas de logs do app.py
+CREATE INDEX ix_SystemEvents_FromHost_ReceivedAt_ID ON SystemEvents (FromHost, ReceivedAt, ID);
+CREATE INDEX ix_SystemEvents_FromHost_EventUser_ReceivedAt ON SystemEvents (FromHost, EventUser, ReceivedAt);
+CREATE INDEX ix_SystemEvents_FromHost_ID ON SystemEvents (FromHost, ID);
+CREATE INDEX ix_SystemEventsProperties_SystemEventID ON SystemEventsProperties (SystemEventID);
@@ -0,0 +1,51 @@
+"""
+Configuração do gunicorn para produção (usada pelo Dockerfile).
+
+Usa workers "gthread": cada processo atende várias requisições em threads,
+de modo que rajadas de uploads dos agentes e consultas são atendidas ao mesmo
+tempo. Cada stream de logs (SSE) aberto ocupa uma dessas threads enquanto a
+aba estiver aberta; por isso o app aceita no máximo LOG_STREAMS_PER_WORKER
+streams por processo (padrão 4) e recusa os excedentes com 503, e a página de
+logs passa a consultar a API periodicamente. Mantenha LOG_STREAMS_PER_WORKER
+bem abaixo de GUNICORN_THREADS. Todos os valores podem ser ajustados por
+variáveis de ambiente.
+
+O pool de conexões de cada processo é dimensionado por DB_POOL_SIZE /
+LOGS_DB_POOL_SIZE (ver `engine_options` em app.py); mantenha
+threads <= pool_size + max_overflow para que nenhuma thread espere por conexão.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('GUNICORN_WORKERS', min(multiprocessing.cpu_count(), 4)))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 16))
+
+# Streams SSE ficam abertos indefinidamente; no gthread o timeout vale para o
+# worker travado, e não para a duração das requisições
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+graceful_timeout = 30
+keepalive = 5
+
+# Recicla os workers periodicamente (com jitter, para não reiniciarem juntos)
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 10000))
+max_requests_jitter = 1000
+
+# O app não é pré-carregado no master: cada worker cria suas próprias
+# engines e pools, sem compartilhar conexões entre processos após o fork
+preload_app = False
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+
+def when_ready(server):
+    # Sem Redis, o cache de respostas é por worker e a invalidação feita pela
+    # ingestão só alcança o worker que gravou o relatório
+    if workers > 1 and not os.environ.get('RESPONSE_CACHE_URL'):
+        server.log.warning(
+            'RESPONSE_CACHE_URL is not set: with %d workers the response cache is per process, '
+            'so the other workers may serve stale pages for up to RESPONSE_CACHE_TTL seconds', workers
+        )
@@ -0,0 +1,74 @@
+"""Add indexed room to system_info
+
+Revision ID: 012a93f4bb3c
+Revises: cb94b631a4a1
+Create Date: 2026-10-18 11:27:03.551820
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012a93f4bb3c'
+down_revision = 'cb94b631a4a1'
+branch_labels = None
+depends_on = None
+
+
+# Cópia de SPECIFIC_ROOMS/DEFAULT_ROOM do app.py no momento desta migração
+SPECIFIC_ROOMS = ("e003", "e006", "e007", "e100", "e101", "e102", "e103", "e104", "e105")
+DEFAULT_ROOM = "dacom"
+
+system_info = sa.table(
+    'system_info',
+    sa.column('id', sa.Integer),
+    sa.column('hostname', sa.String),
+    sa.column('room', sa.String),
+)
+
+
+def upgrade(engine_name):
+    globals()["upgrade_%s" % engine_name]()
+
+
+def downgrade(engine_name):
+    globals()["downgrade_%s" % engine_name]()
+
+
+def upgrade_():
+    with op.batch_alter_table('system_info', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('room', sa.String(length=20), nullable=True))
+        batch_op.create_index(batch_op.f('ix_system_info_room'), ['room'], unique=False)
+
+    # Preenche room a partir do sufixo do hostname
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(system_info.c.id, system_info.c.hostname)).all()
+    values = [
+        {
+            '_id': row.id,
+            '_room': next((room for room in SPECIFIC_ROOMS if row.hostname.endswith(room)), DEFAULT_ROOM),
+        }
+        for row in rows
+    ]
+    if values:
+        connection.execute(
+            system_info.update()
+            .where(system_info.c.id == sa.bindparam('_id'))
+            .values(room=sa.bindparam('_room')),
+            values
+        )
+
+
+def downgrade_():
+    with op.batch_alter_table('system_info', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_system_info_room'))
+        batch_op.drop_column('room')
+
+
+def upgrade_logs():
+    pass
+
+
+def downgrade_logs():
+    pass
@@ -0,0 +1,45 @@
+"""Add report_hash and last_seen to system_info
+
+Revision ID: 271b0aa2b10f
+Revises: 012a93f4bb3c
+Create Date: 2026-10-18 14:05:12.402118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '271b0aa2b10f'
+down_revision = '012a93f4bb3c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade(engine_name):
+    globals()["upgrade_%s" % engine_name]()
+
+
+def downgrade(engine_name):
+    globals()["downgrade_%s" % engine_name]()
+
+
+def upgrade_():
+    with op.batch_alter_table('system_info', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('report_hash', sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column('last_seen', sa.DateTime(), nullable=True))
+
+
+def downgrade_():
+    with op.batch_alter_table('system_info', schema=None) as batch_op:
+        batch_op.drop_column('last_seen')
+        batch_op.drop_column('report_hash')
+
+
+def upgrade_logs():
+    pass
+
+
+def downgrade_logs():
+    pass
+
@@ -0,0 +1,55 @@
+"""Drop memory.total_gb metric series
+
+Revision ID: 3a6f0d2c8e19
+Revises: e7f21b9a4c35
+Create Date: 2026-10-18 21:04:37.218305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3a6f0d2c8e19'
+down_revision = 'e7f21b9a4c35'
+branch_labels = None
+depends_on = None
+
+
+metric_series = sa.table(
+    'metric_series',
+    sa.column('id', sa.Integer),
+    sa.column('name', sa.String),
+)
+metric_points = sa.table(
+    'metric_points',
+    sa.column('series_id', sa.Integer),
+)
+
+
+def upgrade(engine_name):
+    globals()["upgrade_%s" % engine_name]()
+
+
+def downgrade(engine_name):
+    globals()["downgrade_%s" % engine_name]()
+
+
+def upgrade_():
+    # A memória total não varia: a série só repetia o campo memory_total_gb
+    series_ids = sa.select(metric_series.c.id).where(metric_series.c.name == 'memory.total_gb')
+    op.execute(metric_points.delete().where(metric_points.c.series_id.in_(series_ids)))
+    op.execute(metric_series.delete().where(metric_series.c.name == 'memory.total_gb'))
+
+
+def downgrade_():
+    # Os pontos removidos não são recriados; as novas amostras voltariam com o app antigo
+    pass
+
+
+def upgrade_logs():
+    pass
+
+
+def downgrade_logs():
+    pass
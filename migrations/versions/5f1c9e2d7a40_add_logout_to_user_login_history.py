@@ -0,0 +1,43 @@
+"""Add logout to user_login_history
+
+Revision ID: 5f1c9e2d7a40
+Revises: 271b0aa2b10f
+Create Date: 2026-10-18 15:21:47.903512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f1c9e2d7a40'
+down_revision = '271b0aa2b10f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade(engine_name):
+    globals()["upgrade_%s" % engine_name]()
+
+
+def downgrade(engine_name):
+    globals()["downgrade_%s" % engine_name]()
+
+
+def upgrade_():
+    with op.batch_alter_table('user_login_history', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('logout', sa.String(length=120), nullable=True))
+
+
+def downgrade_():
+    with op.batch_alter_table('user_login_history', schema=None) as batch_op:
+        batch_op.drop_column('logout')
+
+
+def upgrade_logs():
+    pass
+
+
+def downgrade_logs():
+    pass
+
@@ -0,0 +1,70 @@
+"""Add indexed node_id to system_info
+
+Revision ID: 825dddb70ec6
+Revises: ae9a9494ea98
+Create Date: 2026-10-18 09:12:40.118305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '825dddb70ec6'
+down_revision = 'ae9a9494ea98'
+branch_labels = None
+depends_on = None
+
+
+system_info = sa.table(
+    'system_info',
+    sa.column('id', sa.Integer),
+    sa.column('uuid1', sa.String),
+    sa.column('node_id', sa.String),
+)
+
+
+def upgrade(engine_name):
+    globals()["upgrade_%s" % engine_name]()
+
+
+def downgrade(engine_name):
+    globals()["downgrade_%s" % engine_name]()
+
+
+def upgrade_():
+    with op.batch_alter_table('system_info', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('node_id', sa.String(length=12), nullable=True))
+        batch_op.create_index(batch_op.f('ix_system_info_node_id'), ['node_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_system_info_hostname'), ['hostname'], unique=False)
+
+    # Preenche node_id com o sufixo do uuid1 (parte após o último '-')
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(system_info.c.id, system_info.c.uuid1)).all()
+    values = [
+        {'_id': row.id, '_node_id': row.uuid1.rsplit('-', 1)[-1]}
+        for row in rows if row.uuid1
+    ]
+    if values:
+        connection.execute(
+            system_info.update()
+            .where(system_info.c.id == sa.bindparam('_id'))
+            .values(node_id=sa.bindparam('_node_id')),
+            values
+        )
+
+
+def downgrade_():
+    with op.batch_alter_table('system_info', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_system_info_hostname'))
+        batch_op.drop_index(batch_op.f('ix_system_info_node_id'))
+        batch_op.drop_column('node_id')
+
+
+def upgrade_logs():
+    pass
+
+
+def downgrade_logs():
+    pass
+
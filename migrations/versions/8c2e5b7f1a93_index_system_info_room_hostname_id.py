@@ -0,0 +1,44 @@
+"""Index system_info by (room, hostname, id)
+
+Revision ID: 8c2e5b7f1a93
+Revises: 3a6f0d2c8e19
+Create Date: 2026-10-18 21:32:10.604117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c2e5b7f1a93'
+down_revision = '3a6f0d2c8e19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade(engine_name):
+    globals()["upgrade_%s" % engine_name]()
+
+
+def downgrade(engine_name):
+    globals()["downgrade_%s" % engine_name]()
+
+
+def upgrade_():
+    with op.batch_alter_table('system_info', schema=None) as batch_op:
+        batch_op.create_index('ix_system_info_room_hostname_id', ['room', 'hostname', 'id'], unique=False)
+        batch_op.drop_index('ix_system_info_room')
+
+
+def downgrade_():
+    with op.batch_alter_table('system_info', schema=None) as batch_op:
+        batch_op.create_index('ix_system_info_room', ['room'], unique=False)
+        batch_op.drop_index('ix_system_info_room_hostname_id')
+
+
+def upgrade_logs():
+    pass
+
+
+def downgrade_logs():
+    pass
@@ -0,0 +1,59 @@
+"""Add metric_series and metric_points
+
+Revision ID: 9b3e47c1d2f8
+Revises: 5f1c9e2d7a40
+Create Date: 2026-10-18 16:42:07.551902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b3e47c1d2f8'
+down_revision = '5f1c9e2d7a40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade(engine_name):
+    globals()["upgrade_%s" % engine_name]()
+
+
+def downgrade(engine_name):
+    globals()["downgrade_%s" % engine_name]()
+
+
+def upgrade_():
+    op.create_table('metric_series',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('system_info_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=160), nullable=False),
+    sa.ForeignKeyConstraint(['system_info_id'], ['system_info.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('system_info_id', 'name', name='uq_metric_series_system_info_id_name')
+    )
+    op.create_table('metric_points',
+    sa.Column('series_id', sa.Integer(), nullable=False),
+    sa.Column('resolution', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('ts', sa.DateTime(), nullable=False),
+    sa.Column('min_value', sa.Float(), nullable=False),
+    sa.Column('max_value', sa.Float(), nullable=False),
+    sa.Column('sum_value', sa.Float(), nullable=False),
+    sa.Column('samples', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['series_id'], ['metric_series.id'], ),
+    sa.PrimaryKeyConstraint('series_id', 'resolution', 'ts')
+    )
+
+
+def downgrade_():
+    op.drop_table('metric_points')
+    op.drop_table('metric_series')
+
+
+def upgrade_logs():
+    pass
+
+
+def downgrade_logs():
+    pass
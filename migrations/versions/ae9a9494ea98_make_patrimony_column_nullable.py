@@ -16,7 +16,15 @@ branch_labels = None
 depends_on = None
 
 
-def upgrade():
+def upgrade(engine_name):
+    globals()["upgrade_%s" % engine_name]()
+
+
+def downgrade(engine_name):
+    globals()["downgrade_%s" % engine_name]()
+
+
+def upgrade_():
     # ### commands auto generated by Alembic - please adjust! ###
     with op.batch_alter_table('system_info', schema=None) as batch_op:
         batch_op.add_column(sa.Column('patrimony', sa.String(length=50), nullable=True))
@@ -24,9 +32,18 @@ def upgrade():
     # ### end Alembic commands ###
 
 
-def downgrade():
+def downgrade_():
     # ### commands auto generated by Alembic - please adjust! ###
     with op.batch_alter_table('system_info', schema=None) as batch_op:
         batch_op.drop_column('patrimony')
 
     # ### end Alembic commands ###
+
+
+def upgrade_logs():
+    pass
+
+
+def downgrade_logs():
+    pass
+
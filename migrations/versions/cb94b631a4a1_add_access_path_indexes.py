@@ -0,0 +1,59 @@
+"""Add access path indexes for routes and SystemEvents
+
+Revision ID: cb94b631a4a1
+Revises: 825dddb70ec6
+Create Date: 2026-10-18 10:04:51.902114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'cb94b631a4a1'
+down_revision = '825dddb70ec6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade(engine_name):
+    globals()["upgrade_%s" % engine_name]()
+
+
+def downgrade(engine_name):
+    globals()["downgrade_%s" % engine_name]()
+
+
+CHILD_TABLES = ('user_login_history', 'ip_and_mac_address', 'mounted_filesystems', 'disk_info', 'gpu_info')
+
+
+def upgrade_():
+    # No MySQL, o índice implícito da chave estrangeira é substituído por este
+    for table in CHILD_TABLES:
+        op.create_index(f'ix_{table}_system_info_id', table, ['system_info_id'], unique=False)
+
+
+def downgrade_():
+    for table in CHILD_TABLES:
+        op.drop_index(f'ix_{table}_system_info_id', table_name=table)
+
+
+def upgrade_logs():
+    # Listagem e paginação por host, ordenadas por (ReceivedAt, ID)
+    op.create_index('ix_SystemEvents_FromHost_ReceivedAt_ID', 'SystemEvents',
+                    ['FromHost', 'ReceivedAt', 'ID'], unique=False)
+    # Filtro de usuário da página de logs
+    op.create_index('ix_SystemEvents_FromHost_EventUser_ReceivedAt', 'SystemEvents',
+                    ['FromHost', 'EventUser', 'ReceivedAt'], unique=False)
+    # Consultas incrementais por ID (after_id e stream de logs)
+    op.create_index('ix_SystemEvents_FromHost_ID', 'SystemEvents',
+                    ['FromHost', 'ID'], unique=False)
+    op.create_index(op.f('ix_SystemEventsProperties_SystemEventID'), 'SystemEventsProperties',
+                    ['SystemEventID'], unique=False)
+
+
+def downgrade_logs():
+    op.drop_index(op.f('ix_SystemEventsProperties_SystemEventID'), table_name='SystemEventsProperties')
+    op.drop_index('ix_SystemEvents_FromHost_ID', table_name='SystemEvents')
+    op.drop_index('ix_SystemEvents_FromHost_EventUser_ReceivedAt', table_name='SystemEvents')
+    op.drop_index('ix_SystemEvents_FromHost_ReceivedAt_ID', table_name='SystemEvents')
@@ -0,0 +1,62 @@
+"""Add SystemEventsSearch and log_watermarks
+
+Revision ID: d4a8c3e51b76
+Revises: 9b3e47c1d2f8
+Create Date: 2026-10-18 17:31:44.208615
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a8c3e51b76'
+down_revision = '9b3e47c1d2f8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade(engine_name):
+    globals()["upgrade_%s" % engine_name]()
+
+
+def downgrade(engine_name):
+    globals()["downgrade_%s" % engine_name]()
+
+
+def upgrade_():
+    pass
+
+
+def downgrade_():
+    pass
+
+
+def upgrade_logs():
+    op.create_table('SystemEventsSearch',
+    sa.Column('ID', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('ReceivedAt', sa.DateTime(), nullable=True),
+    sa.Column('FromHost', sa.String(length=60), nullable=True),
+    sa.Column('SysLogTag', sa.String(length=60), nullable=True),
+    sa.Column('Message', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('ID')
+    )
+    op.create_index('ix_SystemEventsSearch_ReceivedAt', 'SystemEventsSearch', ['ReceivedAt'], unique=False)
+    op.create_index('ix_SystemEventsSearch_FromHost_ID', 'SystemEventsSearch', ['FromHost', 'ID'], unique=False)
+    # SystemEvents pode ser particionada, e o MySQL não aceita FULLTEXT em tabelas particionadas
+    op.create_index('ft_SystemEventsSearch_Message', 'SystemEventsSearch', ['Message'], unique=False,
+                    mysql_prefix='FULLTEXT')
+    op.create_table('log_watermarks',
+    sa.Column('name', sa.String(length=60), nullable=False),
+    sa.Column('last_id', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade_logs():
+    op.drop_table('log_watermarks')
+    op.drop_index('ft_SystemEventsSearch_Message', table_name='SystemEventsSearch')
+    op.drop_index('ix_SystemEventsSearch_FromHost_ID', table_name='SystemEventsSearch')
+    op.drop_index('ix_SystemEventsSearch_ReceivedAt', table_name='SystemEventsSearch')
+    op.drop_table('SystemEventsSearch')
@@ -0,0 +1,47 @@
+"""Add SystemEventsHourly
+
+Revision ID: e7f21b9a4c35
+Revises: d4a8c3e51b76
+Create Date: 2026-10-18 18:20:53.674190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7f21b9a4c35'
+down_revision = 'd4a8c3e51b76'
+branch_labels = None
+depends_on = None
+
+
+def upgrade(engine_name):
+    globals()["upgrade_%s" % engine_name]()
+
+
+def downgrade(engine_name):
+    globals()["downgrade_%s" % engine_name]()
+
+
+def upgrade_():
+    pass
+
+
+def downgrade_():
+    pass
+
+
+def upgrade_logs():
+    op.create_table('SystemEventsHourly',
+    sa.Column('Hour', sa.DateTime(), nullable=False),
+    sa.Column('FromHost', sa.String(length=60), nullable=False),
+    sa.Column('Facility', sa.SmallInteger(), autoincrement=False, nullable=False),
+    sa.Column('Priority', sa.SmallInteger(), autoincrement=False, nullable=False),
+    sa.Column('Events', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('Hour', 'FromHost', 'Facility', 'Priority')
+    )
+
+
+def downgrade_logs():
+    op.drop_table('SystemEventsHourly')
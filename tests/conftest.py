@@ -0,0 +1,86 @@
+"""
+Fixtures compartilhadas: o app com os dois bancos em SQLite em memória e o
+agente de inventário, com o estado em um diretório temporário.
+"""
+import importlib.util
+import os
+
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+os.environ.setdefault('LOGS_DATABASE_URL', 'sqlite://')
+
+import pytest
+
+import app as inventory
+
+AGENT_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'utf-inventory-agent.py')
+
+
+def load_agent():
+    # O nome do arquivo do agente tem hífens e não pode ser importado com `import`
+    spec = importlib.util.spec_from_file_location('utf_inventory_agent', AGENT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+inventory_agent = load_agent()
+
+
+@pytest.fixture
+def client():
+    inventory.app.config.update(TESTING=True, INGEST_ASYNC=False, RESPONSE_CACHE=False)
+    with inventory.app.app_context():
+        inventory.db.create_all()
+    yield inventory.app.test_client()
+    with inventory.app.app_context():
+        inventory.db.session.remove()
+        inventory.db.drop_all()
+    inventory.host_cache.clear()
+    inventory.host_directory.invalidate()
+    inventory.response_cache.clear()
+
+
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    monkeypatch.setattr(inventory_agent, 'STATE_DIRECTORY', str(tmp_path))
+    monkeypatch.setattr(inventory_agent, 'UNSUPPORTED_ENCODINGS', set())
+    return inventory_agent
+
+
+def make_report(rows=1, **overrides):
+    """
+    Monta um relatório completo do agente para lab1-e003, com `rows` linhas
+    em cada tabela filha; `overrides` substitui ou acrescenta campos.
+    """
+    data = {
+        'hostname': 'lab1-e003', 'uuid1': '1234-5678-9abc-def0-00000000abcd',
+        'linux_distribution': 'Ubuntu 22.04', 'kernel_version': '6.1', 'logged_in_user': 'aluno',
+        'cpu_model': 'i5', 'memory_total_gb': 16.0, 'collection_datetime': '2026-10-18 08:00:00',
+        'motherboard_model': 'mb', 'patrimony': None, 'report_hash': 'abc123',
+        'user_login_history': [
+            {'user': f'user{i}', 'tty': 'pts/0', 'ip': '10.0.0.1', 'datetime': '2026-10-18 07:00',
+             'logout': None}
+            for i in range(rows)
+        ],
+        'ip_and_mac_addresses': [
+            {'interface': f'eth{i}', 'ip': f'10.0.0.{i}', 'mac': f'aa:bb:cc:dd:ee:0{i}'} for i in range(rows)
+        ],
+        'mounted_filesystems': [
+            {'device': f'/dev/sda{i}', 'mountpoint': f'/mnt/{i}', 'fstype': 'ext4',
+             'total': 100.0, 'used': 40.0, 'free': 60.0}
+            for i in range(rows)
+        ],
+        'disk_info': {'total': 500.0, 'free': 200.0},
+        'gpu_info': [
+            {'gpu_id': i, 'name': 'GTX', 'driver_version': '550', 'memory_total': 8192.0,
+             'memory_free': 4096.0, 'memory_used': 4096.0, 'temperature': 50.0}
+            for i in range(rows)
+        ],
+    }
+    data.update(overrides)
+    return data
+
+
+@pytest.fixture
+def report():
+    return make_report
@@ -0,0 +1,27 @@
+"""
+Execução dos coletores do agente com tempo máximo (`run_collectors`).
+"""
+import threading
+
+
+def test_hung_collector_is_not_started_again_until_it_returns(agent, monkeypatch):
+    monkeypatch.setattr(agent, 'HUNG_COLLECTORS', {})
+    release = threading.Event()
+    calls = []
+
+    def hangs():
+        calls.append(1)
+        release.wait(5)
+        return 'value'
+
+    collectors = (('hangs', hangs, 'Unknown', 0.05), ('quick', lambda: 'ok', None, 1))
+
+    assert agent.run_collectors(collectors) == ({'hangs': 'Unknown', 'quick': 'ok'}, ['hangs'])
+    assert agent.run_collectors(collectors) == ({'hangs': 'Unknown', 'quick': 'ok'}, ['hangs'])
+    assert len(calls) == 1
+
+    release.set()
+    agent.HUNG_COLLECTORS['hangs'].join(1)
+
+    assert agent.run_collectors(collectors) == ({'hangs': 'value', 'quick': 'ok'}, [])
+    assert len(calls) == 2
@@ -0,0 +1,122 @@
+"""
+Envio dos relatórios pelo agente: protocolo condicional (`send_system_info`,
+com relatório completo, heartbeat e delta) e compressão (`post_json`).
+"""
+from types import SimpleNamespace
+
+import pytest
+
+
+def system_info(**extra):
+    data = {
+        'hostname': 'lab1-e003', 'uuid1': '1234-5678-9abc-def0-00000000abcd',
+        'collection_datetime': '2026-10-18 08:00:00', 'linux_distribution': 'Ubuntu 22.04',
+        'kernel_version': '6.1', 'logged_in_user': 'aluno', 'cpu_model': 'i5',
+        'memory_total_gb': 16.0, 'motherboard_model': 'mb',
+        'disk_info': {'total': 500.0, 'free': 200.0},
+    }
+    data.update(extra)
+    return data
+
+
+@pytest.fixture
+def server(agent, monkeypatch):
+    """
+    Substitui a coleta e o envio: `server.info` é o próximo relatório
+    coletado, `server.status` as respostas a devolver e `server.posts` os
+    envios feitos, como (payload, headers).
+    """
+    server = SimpleNamespace(info=system_info(), status=[], posts=[])
+
+    def post_report(payload, headers=None):
+        server.posts.append((payload, headers or {}))
+        status = server.status.pop(0)
+        return None if status is None else SimpleNamespace(status_code=status, ok=status < 400)
+
+    monkeypatch.setattr(agent, 'collect_system_info', lambda static_cache=None: dict(server.info))
+    monkeypatch.setattr(agent, 'post_report', post_report)
+    return server
+
+
+def test_unchanged_report_becomes_a_heartbeat(agent, server):
+    server.status = [201, 304]
+    agent.send_system_info()
+    server.info['collection_datetime'] = '2026-10-18 08:15:00'
+    agent.send_system_info()
+
+    full, _ = server.posts[0]
+    heartbeat, headers = server.posts[1]
+    assert 'cpu_model' in full
+    assert headers == {'If-None-Match': f'"{full["report_hash"]}"'}
+    assert heartbeat == {'hostname': 'lab1-e003', 'uuid1': full['uuid1'],
+                         'collection_datetime': '2026-10-18 08:15:00', 'report_hash': full['report_hash']}
+
+
+def test_changed_section_is_sent_as_delta(agent, server):
+    server.status = [201, 200]
+    agent.send_system_info()
+    base_hash = server.posts[0][0]['report_hash']
+    server.info['kernel_version'] = '6.8'
+    agent.send_system_info()
+
+    delta, headers = server.posts[1]
+    assert headers == {'If-Match': f'"{base_hash}"'}
+    assert delta['delta'] is True
+    assert delta['kernel_version'] == '6.8'
+    assert 'cpu_model' not in delta and 'disk_info' not in delta
+    assert agent.load_report_state()['report_hash'] == delta['report_hash']
+
+
+def test_precondition_failed_resends_full_report(agent, server):
+    server.status = [201, 412, 201]
+    agent.send_system_info()
+    server.info['kernel_version'] = '6.8'
+    agent.send_system_info()
+
+    full, headers = server.posts[2]
+    assert headers == {}
+    assert full['kernel_version'] == '6.8' and 'cpu_model' in full
+    assert agent.load_report_state()['report_hash'] == full['report_hash']
+
+
+def test_unavailable_server_spools_full_report(agent, server, tmp_path):
+    server.status = [None]
+    agent.send_system_info()
+
+    spooled = agent.read_spool(str(tmp_path / agent.SPOOL_FILE))
+    assert [report['cpu_model'] for report in spooled] == ['i5']
+    assert agent.load_backoff(str(tmp_path))['failures'] == 1
+    assert agent.load_report_state() == {}
+
+
+def fake_post(statuses, posts):
+    def post(url, data=None, headers=None, timeout=None):
+        posts.append(headers.get('Content-Encoding', 'identity'))
+        status, text = statuses.pop(0)
+        return SimpleNamespace(status_code=status, text=text, ok=status < 400)
+    return post
+
+
+def test_only_undecodable_or_unsupported_bodies_are_resent(agent, monkeypatch):
+    requests = pytest.importorskip('requests')
+    payload = {'hostname': 'lab1-e003', 'padding': 'x' * 2 * agent.COMPRESSION_MIN_BYTES}
+    # Sem zstd, a primeira tentativa é sempre gzip
+    agent.UNSUPPORTED_ENCODINGS.add('zstd')
+
+    posts = []
+    monkeypatch.setattr(requests, 'post', fake_post([(400, 'Invalid report: cpu_model required')], posts))
+    assert agent.post_json(agent.UPLOAD_URL, payload).status_code == 400
+    assert posts == ['gzip']
+
+    posts = []
+    monkeypatch.setattr(requests, 'post', fake_post(
+        [(400, '<p>Invalid compressed body</p>'), (201, '{}')], posts))
+    assert agent.post_json(agent.UPLOAD_URL, payload).status_code == 201
+    assert posts == ['gzip', 'identity']
+    assert agent.UNSUPPORTED_ENCODINGS == {'zstd'}
+
+    posts = []
+    monkeypatch.setattr(requests, 'post', fake_post([(415, ''), (201, '{}')], posts))
+    assert agent.post_json(agent.UPLOAD_URL, payload).status_code == 201
+    assert posts == ['gzip', 'identity']
+    assert agent.UNSUPPORTED_ENCODINGS == {'zstd', 'gzip'}
@@ -0,0 +1,91 @@
+"""
+Spool de relatórios não enviados do agente (utf-inventory-agent.py).
+"""
+import json
+import os
+from types import SimpleNamespace
+
+
+def spooled(agent, directory):
+    return agent.read_spool(os.path.join(directory, agent.SPOOL_FILE))
+
+
+def test_truncated_line_is_discarded_and_next_report_starts_a_new_line(agent, tmp_path):
+    path = tmp_path / agent.SPOOL_FILE
+    path.write_bytes(json.dumps({'n': 1}).encode() + b'\n' + b'{"n": 2, "hostn')
+
+    assert spooled(agent, str(tmp_path)) == [{'n': 1}]
+
+    agent.spool_report(str(tmp_path), {'n': 3})
+
+    assert spooled(agent, str(tmp_path)) == [{'n': 1}, {'n': 3}]
+
+
+def test_spool_size_cap_drops_oldest_reports(agent, tmp_path, monkeypatch):
+    line_size = len(json.dumps({'n': 0}).encode()) + 1
+    monkeypatch.setattr(agent, 'SPOOL_MAX_BYTES', 3 * line_size)
+
+    for n in range(5):
+        agent.spool_report(str(tmp_path), {'n': n})
+
+    assert spooled(agent, str(tmp_path)) == [{'n': 2}, {'n': 3}, {'n': 4}]
+    assert os.path.getsize(tmp_path / agent.SPOOL_FILE) <= agent.SPOOL_MAX_BYTES
+
+
+def test_replay_gives_up_while_another_process_holds_the_lock(agent, tmp_path, monkeypatch):
+    agent.spool_report(str(tmp_path), {'n': 1})
+    posts = []
+    monkeypatch.setattr(agent, 'post_json', lambda url, payload, headers=None: posts.append(payload))
+
+    with agent.spool_lock(str(tmp_path)):
+        assert agent.replay_spool(str(tmp_path)) is False
+
+    assert posts == []
+    assert spooled(agent, str(tmp_path)) == [{'n': 1}]
+
+
+def fake_server(posts, bad=None, down=False):
+    def post_json(url, payload, headers=None):
+        posts.append([report['n'] for report in payload])
+        if down or (bad is not None and any(report['n'] == bad for report in payload)):
+            return SimpleNamespace(status_code=500, ok=False)
+        return SimpleNamespace(status_code=200, ok=True)
+    return post_json
+
+
+def expire_backoff(agent, directory, failures):
+    with open(directory / agent.SPOOL_BACKOFF_FILE, 'w') as f:
+        json.dump({'failures': failures, 'retry_at': 0}, f)
+
+
+def test_replay_sends_batch_one_by_one_after_repeated_failures(agent, tmp_path, monkeypatch):
+    for n in range(3):
+        agent.spool_report(str(tmp_path), {'n': n})
+    posts = []
+    monkeypatch.setattr(agent, 'post_json', fake_server(posts, bad=1))
+
+    for failures in range(agent.SPOOL_SPLIT_AFTER):
+        expire_backoff(agent, tmp_path, failures)
+        assert agent.replay_spool(str(tmp_path)) is False
+    assert posts == [[0, 1, 2]] * agent.SPOOL_SPLIT_AFTER
+
+    expire_backoff(agent, tmp_path, agent.SPOOL_SPLIT_AFTER)
+    assert agent.replay_spool(str(tmp_path)) is True
+
+    assert posts[agent.SPOOL_SPLIT_AFTER:] == [[0], [1], [2]]
+    assert not (tmp_path / agent.SPOOL_FILE).exists()
+    assert not (tmp_path / agent.SPOOL_BACKOFF_FILE).exists()
+
+
+def test_replay_keeps_batch_when_server_is_down(agent, tmp_path, monkeypatch):
+    for n in range(2):
+        agent.spool_report(str(tmp_path), {'n': n})
+    posts = []
+    monkeypatch.setattr(agent, 'post_json', fake_server(posts, down=True))
+    expire_backoff(agent, tmp_path, agent.SPOOL_SPLIT_AFTER)
+
+    assert agent.replay_spool(str(tmp_path)) is False
+
+    assert posts == [[0], [1]]
+    assert spooled(agent, str(tmp_path)) == [{'n': 0}, {'n': 1}]
+    assert agent.load_backoff(str(tmp_path))['failures'] == agent.SPOOL_SPLIT_AFTER + 1
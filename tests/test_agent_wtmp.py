@@ -0,0 +1,97 @@
+"""
+Leitura incremental do wtmp pelo agente (`read_wtmp_sessions`).
+"""
+import os
+from datetime import datetime
+
+LOGIN = 1760781600  # 2025-10-18 10:00 UTC
+
+
+def record(agent, ut_type, line='', user='', host='', seconds=LOGIN):
+    return agent.UTMP_RECORD.pack(
+        ut_type, 0, 1234, line.encode(), b'', user.encode(), host.encode(),
+        0, 0, 0, seconds, 0, 0, 0, 0, 0, b''
+    )
+
+
+def append(path, *records):
+    with open(path, 'ab') as f:
+        f.write(b''.join(records))
+
+
+def stamp(seconds):
+    return datetime.fromtimestamp(seconds).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def test_dead_process_closes_session_and_only_new_records_are_read(agent, tmp_path):
+    wtmp = tmp_path / 'wtmp'
+    append(wtmp, record(agent, agent.UTMP_USER_PROCESS, 'pts/0', 'alice', '10.0.0.5'))
+    checkpoint = agent.read_wtmp_sessions(str(wtmp), {})
+
+    assert checkpoint['sessions']['alice'] == {
+        'user': 'alice', 'tty': 'pts/0', 'ip': '10.0.0.5', 'datetime': stamp(LOGIN), 'logout': None,
+    }
+    assert checkpoint['offset'] == agent.UTMP_RECORD.size
+
+    # Um registro pela metade (escrita em andamento) fica para a próxima leitura
+    closing = record(agent, agent.UTMP_DEAD_PROCESS, 'pts/0', seconds=LOGIN + 60)
+    append(wtmp, closing[:100])
+    checkpoint = agent.read_wtmp_sessions(str(wtmp), checkpoint)
+    assert checkpoint['offset'] == agent.UTMP_RECORD.size
+    assert checkpoint['sessions']['alice']['logout'] is None
+
+    with open(wtmp, 'r+b') as f:
+        f.truncate(agent.UTMP_RECORD.size)
+    append(wtmp, closing)
+    checkpoint = agent.read_wtmp_sessions(str(wtmp), checkpoint)
+
+    assert checkpoint['offset'] == 2 * agent.UTMP_RECORD.size
+    assert checkpoint['sessions']['alice']['logout'] == stamp(LOGIN + 60)
+    assert checkpoint['open'] == {}
+
+
+def test_boot_time_closes_every_open_session(agent, tmp_path):
+    wtmp = tmp_path / 'wtmp'
+    append(
+        wtmp,
+        record(agent, agent.UTMP_USER_PROCESS, 'tty1', 'alice'),
+        record(agent, agent.UTMP_USER_PROCESS, 'pts/1', 'bob', '10.0.0.6', seconds=LOGIN + 10),
+        record(agent, agent.UTMP_BOOT_TIME, '~', 'reboot', seconds=LOGIN + 3600),
+    )
+
+    sessions = agent.read_wtmp_sessions(str(wtmp), {})['sessions']
+
+    assert sessions['alice']['logout'] == stamp(LOGIN + 3600)
+    assert sessions['bob']['logout'] == stamp(LOGIN + 3600)
+
+
+def test_rotated_or_shrunk_file_is_read_from_the_start(agent, tmp_path):
+    wtmp = tmp_path / 'wtmp'
+    append(wtmp, record(agent, agent.UTMP_USER_PROCESS, 'tty1', 'alice'),
+           record(agent, agent.UTMP_USER_PROCESS, 'tty2', 'bob'))
+    checkpoint = agent.read_wtmp_sessions(str(wtmp), {})
+
+    # Rotação: um arquivo novo (outro inode) no mesmo caminho
+    rotated = tmp_path / 'wtmp.new'
+    append(rotated, record(agent, agent.UTMP_USER_PROCESS, 'pts/3', 'carol', seconds=LOGIN + 60))
+    os.replace(rotated, wtmp)
+    checkpoint = agent.read_wtmp_sessions(str(wtmp), checkpoint)
+
+    assert set(checkpoint['sessions']) == {'alice', 'bob', 'carol'}
+    assert checkpoint['offset'] == agent.UTMP_RECORD.size
+
+    # Arquivo truncado no mesmo inode: menor que o offset salvo
+    checkpoint['offset'] = 3 * agent.UTMP_RECORD.size
+    checkpoint = agent.read_wtmp_sessions(str(wtmp), checkpoint)
+
+    assert checkpoint['offset'] == agent.UTMP_RECORD.size
+    assert checkpoint['sessions']['carol']['tty'] == 'pts/3'
+
+
+def test_login_history_saves_checkpoint_in_state_directory(agent, tmp_path, monkeypatch):
+    wtmp = tmp_path / 'wtmp'
+    append(wtmp, record(agent, agent.UTMP_USER_PROCESS, 'tty1', 'alice'))
+    monkeypatch.setattr(agent, 'WTMP_FILE', str(wtmp))
+
+    assert [session['user'] for session in agent.get_user_login_history()] == ['alice']
+    assert agent.load_state(agent.WTMP_CHECKPOINT_FILE)['offset'] == agent.UTMP_RECORD.size
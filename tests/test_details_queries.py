@@ -0,0 +1,34 @@
+"""
+Garante que a página de detalhes e /api/hosts/<id> carregam uma máquina com
+todas as tabelas filhas em um número fixo de consultas (sem N+1).
+"""
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+MAX_STATEMENTS = 5
+
+
+@pytest.fixture
+def statements():
+    executed = []
+
+    def count(connection, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(Engine, 'before_cursor_execute', count)
+    yield executed
+    event.remove(Engine, 'before_cursor_execute', count)
+
+
+@pytest.mark.parametrize('path', ['/details/{id}', '/api/hosts/{id}'])
+def test_host_details_use_fixed_number_of_statements(client, statements, report, path):
+    response = client.post('/api/upload', json=report(rows=4))
+    assert response.status_code == 201
+    host_id = client.get('/api/hosts?fields=id').get_json()['hosts'][0]['id']
+
+    statements.clear()
+    response = client.get(path.format(id=host_id))
+
+    assert response.status_code == 200
+    assert len(statements) <= MAX_STATEMENTS, statements
@@ -0,0 +1,25 @@
+"""
+Gravação em lote da fila de ingestão (`IngestQueue.write`).
+"""
+import logging
+
+import app as inventory
+
+
+def test_failed_batch_is_logged_without_sleeping_after_last_attempt(client, monkeypatch, caplog):
+    sleeps = []
+    monkeypatch.setattr(inventory.time, 'sleep', sleeps.append)
+
+    def fail(reports):
+        raise RuntimeError('database down')
+
+    monkeypatch.setattr(inventory, 'ingest_reports', fail)
+    ingest_queue = inventory.IngestQueue(max_size=10, batch_size=10, batch_wait=0, retries=2)
+
+    with caplog.at_level(logging.ERROR):
+        ingest_queue.write([{'hostname': 'lab1-e003'}, {'hostname': 'lab2-e003'}])
+
+    assert sleeps == [1, 2]
+    assert ingest_queue.counters['failed'] == 2
+    dropped = [record.getMessage() for record in caplog.records if 'dropped' in record.getMessage()]
+    assert dropped and 'lab1-e003' in dropped[0] and 'lab2-e003' in dropped[0]
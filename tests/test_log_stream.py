@@ -0,0 +1,27 @@
+"""
+Limite de streams de logs (SSE) simultâneos por processo.
+"""
+import app as inventory
+
+
+def test_streams_over_the_limit_are_refused_until_one_closes(client, report, monkeypatch):
+    monkeypatch.setattr(inventory, 'log_stream_slots', inventory.threading.BoundedSemaphore(2))
+    monkeypatch.setattr(inventory, 'LOG_STREAM_KEEPALIVE', 0.01)
+    response = client.post('/api/upload', json=report())
+    assert response.status_code == 201
+    url = '/api/logs/machine/1/stream'
+
+    streams = [client.get(url, buffered=False) for _ in range(2)]
+    assert [stream.status_code for stream in streams] == [200, 200]
+
+    refused = client.get(url, buffered=False)
+    assert refused.status_code == 503
+    assert refused.headers['Retry-After']
+
+    streams[0].close()
+    reopened = client.get(url, buffered=False)
+    assert reopened.status_code == 200
+
+    for stream in (streams[1], reopened):
+        stream.close()
+    assert inventory.log_stream_slots.acquire(blocking=False)
@@ -0,0 +1,44 @@
+"""
+Cache de respostas: ETag, 304 e invalidação pela ingestão.
+"""
+import app as inventory
+
+def etag(client, path):
+    response = client.get(path)
+    assert response.status_code == 200
+    return response.headers['ETag']
+
+
+def test_unchanged_page_gets_304(client, report, monkeypatch):
+    monkeypatch.setitem(inventory.app.config, 'RESPONSE_CACHE', True)
+    client.post('/api/upload', json=report())
+    tag = etag(client, '/details/1')
+
+    response = client.get('/details/1', headers={'If-None-Match': tag})
+
+    assert response.status_code == 304
+
+
+def test_heartbeat_keeps_listing_cached_and_refreshes_details(client, report, monkeypatch):
+    monkeypatch.setitem(inventory.app.config, 'RESPONSE_CACHE', True)
+    client.post('/api/upload', json=report())
+    listing, details = etag(client, '/'), etag(client, '/details/1')
+
+    response = client.post('/api/upload', headers={'If-None-Match': '"abc123"'},
+                           json={'hostname': 'lab1-e003', 'uuid1': report()['uuid1'],
+                                 'collection_datetime': '2026-10-18 09:00:00'})
+
+    assert response.status_code == 304
+    assert etag(client, '/') == listing
+    assert etag(client, '/details/1') != details
+
+
+def test_report_invalidates_host_room_and_fleet_listings(client, report, monkeypatch):
+    monkeypatch.setitem(inventory.app.config, 'RESPONSE_CACHE', True)
+    client.post('/api/upload', json=report())
+    before = [etag(client, path) for path in ('/', '/?room=e003', '/details/1')]
+
+    client.post('/api/upload', json=report(kernel_version='6.9', report_hash='def456'))
+
+    after = [etag(client, path) for path in ('/', '/?room=e003', '/details/1')]
+    assert all(old != new for old, new in zip(before, after))
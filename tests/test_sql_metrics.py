@@ -0,0 +1,18 @@
+"""
+Instrumentação dos comandos SQL (listeners before/after_cursor_execute).
+"""
+import pytest
+from sqlalchemy.exc import OperationalError
+
+import app as inventory
+
+
+def test_failed_statement_leaves_no_state_on_the_connection(client):
+    with inventory.app.app_context():
+        with inventory.db.engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.exec_driver_sql('SELECT * FROM missing_table')
+            assert 'query_started' not in connection.info
+            assert connection.exec_driver_sql('SELECT 1').scalar() == 1
+
+    assert 'sql_statements_total{bind="default"' in inventory.metrics.render()
@@ -0,0 +1,34 @@
+"""
+Protocolo condicional de /api/upload (heartbeat com If-None-Match).
+"""
+import app as inventory
+
+def stored_collection_datetime():
+    with inventory.app.app_context():
+        return inventory.db.session.execute(
+            inventory.db.select(inventory.SystemInfo.collection_datetime)
+        ).scalar()
+
+
+def test_heartbeat_renews_collection_datetime(client, report):
+    assert client.post('/api/upload', json=report()).status_code == 201
+
+    response = client.post(
+        '/api/upload', headers={'If-None-Match': '"abc123"'},
+        json={'hostname': 'lab1-e003', 'uuid1': report()['uuid1'],
+              'collection_datetime': '2026-10-18 09:00:00'}
+    )
+
+    assert response.status_code == 304
+    assert stored_collection_datetime() == '2026-10-18 09:00:00'
+
+
+def test_heartbeat_without_collection_datetime_keeps_stored_value(client, report):
+    assert client.post('/api/upload', json=report()).status_code == 201
+
+    response = client.post('/api/upload', headers={'If-None-Match': '"abc123"'},
+                           json={'hostname': 'lab1-e003', 'uuid1': report()['uuid1']})
+
+    assert response.status_code == 304
+    assert stored_collection_datetime() == '2026-10-18 08:00:00'
+    assert client.get('/api/hosts').status_code == 200
@@ -0,0 +1,54 @@
+"""
+Gravação de vários relatórios por /api/upload/batch.
+"""
+import app as inventory
+
+
+def host(report, number, **overrides):
+    return report(hostname=f'lab1-e00{number}', uuid1=f'1234-5678-9abc-def0-00000000abc{number}', **overrides)
+
+
+def stored_hostnames():
+    with inventory.app.app_context():
+        return set(inventory.db.session.execute(inventory.db.select(inventory.SystemInfo.hostname)).scalars())
+
+
+def test_invalid_report_is_rejected_without_failing_the_batch(client, report):
+    response = client.post('/api/upload/batch', json=[
+        host(report, 1),
+        host(report, 2, cpu_model=None),
+        host(report, 4, gpu_info=[{'gpu_id': 0, 'name': 'GT 730'}]),
+        host(report, 3),
+    ])
+
+    assert response.status_code == 200
+    statuses = [result['status'] for result in response.get_json()['results']]
+    assert statuses == ['created', 'error', 'error', 'created']
+    assert stored_hostnames() == {'lab1-e001', 'lab1-e003'}
+
+
+def test_report_refused_by_database_is_written_apart_from_the_batch(client, report, monkeypatch):
+    # Sem a validação, o NOT NULL de system_info derruba a transação do lote
+    monkeypatch.setattr(inventory, 'validate_report', inventory.build_child_rows)
+    response = client.post('/api/upload/batch', json=[
+        host(report, 1), host(report, 2, cpu_model=None), host(report, 3),
+    ])
+
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [result['status'] for result in results] == ['created', 'error', 'created']
+    assert results[1]['message'] == 'write failed'
+    assert stored_hostnames() == {'lab1-e001', 'lab1-e003'}
+
+
+def test_database_outage_returns_500_without_leaking_the_error(client, report, monkeypatch):
+    def fail(pending, results):
+        raise RuntimeError('INSERT INTO system_info ... secret parameters')
+
+    monkeypatch.setattr(inventory, 'write_reports', fail)
+    response = client.post('/api/upload/batch', json=[
+        host(report, 1), host(report, 3),
+    ])
+
+    assert response.status_code == 500
+    assert 'INSERT' not in response.get_data(as_text=True)
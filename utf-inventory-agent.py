@@ -3,16 +3,23 @@
 import os
 import pwd
 import platform
-import psutil
 import socket
 import json
 import uuid
-import requests
-import distro
-import GPUtil
+import hashlib
+import gzip
+import argparse
+import importlib.util
+import fcntl
+import mmap
+import struct
+import random
+from contextlib import contextmanager
 from datetime import datetime
 import subprocess
 import sys
+import threading
+import time
 
 import logging
 
@@ -30,10 +37,80 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Tempo máximo de cada verificação de uso de um ponto de montagem (NFS/CIFS podem travar)
+MOUNT_USAGE_TIMEOUT = 2
+
+# Tempo máximo total da coleta; coletores que não terminarem a tempo são descartados
+COLLECTION_TIME_BUDGET = 20
+
+UPLOAD_URL = 'http://apps.dacom:5000/api/upload'
+UPLOAD_BATCH_URL = 'http://apps.dacom:5000/api/upload/batch'
+
+# Tempo máximo de cada requisição ao servidor
+REQUEST_TIMEOUT = 10
+
+# Corpos maiores que isso são compactados (zstd se o pacote zstandard estiver
+# instalado, senão gzip); codificações recusadas pelo servidor (415) são abandonadas
+COMPRESSION_MIN_BYTES = 1024
+UNSUPPORTED_ENCODINGS = set()
+# Mensagem do 400 do servidor (read_request_body) para um corpo compactado que
+# ele não conseguiu descompactar; outros 400 não são culpa da compressão
+INVALID_COMPRESSED_BODY = 'Invalid compressed body'
+
+# Fila local (spool) de relatórios não enviados, reenviados em lotes
+SPOOL_FILE = 'spool.jsonl'
+SPOOL_LOCK_FILE = 'spool.lock'
+SPOOL_BACKOFF_FILE = 'spool-backoff.json'
+SPOOL_MAX_BYTES = 5 * 1024 * 1024
+SPOOL_BATCH_SIZE = 20
+# Falhas seguidas sem progresso após as quais o primeiro lote é reenviado um
+# relatório por vez, para isolar um relatório que o servidor não consegue gravar
+SPOOL_SPLIT_AFTER = 3
+
+# Espera entre tentativas de reenvio: exponencial a partir de BACKOFF_BASE, limitada
+# a BACKOFF_MAX e sorteada (jitter) para que as máquinas não voltem todas juntas
+BACKOFF_BASE = 60
+BACKOFF_MAX = 6 * 60 * 60
+
+# Registro utmp do glibc (x86_64): tipo, pid, linha, id, usuário, host, saída, sessão,
+# horário (segundos, microssegundos), endereço IPv6 e reservado; 384 bytes
+WTMP_FILE = '/var/log/wtmp'
+UTMP_RECORD = struct.Struct('<hhi32s4s32s256shhiii4i20s')
+UTMP_RUN_LVL = 1
+UTMP_BOOT_TIME = 2
+UTMP_USER_PROCESS = 7
+UTMP_DEAD_PROCESS = 8
+
+# Estado do último relatório aceito (hashes por seção), usado para envios incrementais
+STATE_DIRECTORY = '/var/lib/utf-inventory-agent'
+REPORT_STATE_FILE = 'report-state.json'
+# Posição já lida do wtmp e sessões conhecidas, para ler só os registros novos
+WTMP_CHECKPOINT_FILE = 'wtmp-checkpoint.json'
+
+# Campos que mudam a cada coleta e não entram no hash do relatório
+VOLATILE_FIELDS = ('uuid1', 'collection_datetime', 'incomplete_sections')
+
+# Intervalo entre coletas no modo daemon e atraso aleatório máximo (splay) somado a
+# cada espera, para que as máquinas do laboratório não enviem todas ao mesmo tempo
+DAEMON_INTERVAL = 15 * 60
+DAEMON_SPLAY = 5 * 60
+
+# Seções que não mudam enquanto a máquina está ligada; no modo daemon são
+# coletadas uma única vez e reaproveitadas nos ciclos seguintes
+STATIC_SECTIONS = ('linux_distribution', 'kernel_version', 'cpu_model', 'memory_total_gb', 'motherboard_model')
+
+# Pontos de montagem cuja consulta de uso ainda não retornou: mountpoint -> thread
+HUNG_MOUNTS = {}
+# Coletores que estouraram o tempo e ainda não retornaram: seção -> thread
+HUNG_COLLECTORS = {}
+
 # Função para instalar as bibliotecas necessárias
 def install_packages():
     """
     Instala as bibliotecas necessárias usando pip se não estiverem instaladas.
+
+    Apenas verifica se os módulos existem (sem importá-los); as bibliotecas
+    são importadas sob demanda pelos coletores que as usam.
     """
     required_packages = [
         'requests',  # Biblioteca para fazer requisições HTTP
@@ -43,9 +120,7 @@ def install_packages():
     ]
     
     for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
+        if importlib.util.find_spec(package) is None:
             subprocess.check_call([sys.executable, '-m', 'pip', 'install', package])
 
 def get_linux_distribution():
@@ -55,6 +130,7 @@ def get_linux_distribution():
     Returns:
         str: Nome e versão da distribuição Linux.
     """
+    import distro
     name = distro.name()
     version = distro.version()
     return f"{name} {version}"
@@ -71,6 +147,9 @@ def get_kernel_version():
 def get_logged_in_user():
     """
     Obtém o nome do usuário que está logado no sistema.
+
+    Sem terminal de controle (modo daemon, como serviço do systemd), usa o
+    usuário da sessão mais recente entre as abertas.
     
     Returns:
         str: Nome do usuário logado.
@@ -78,13 +157,102 @@ def get_logged_in_user():
     try:
         return os.getlogin()
     except OSError:
-        return pwd.getpwuid(os.getuid())[0]
+        pass
+    import psutil
+    users = psutil.users()
+    if users:
+        return max(users, key=lambda user: user.started).name
+    return pwd.getpwuid(os.getuid())[0]
 
 
 def get_user_login_history():
     """
-    Obtém o histórico de logins de usuários no sistema.
-    
+    Obtém a última sessão de cada usuário no sistema.
+
+    Lê o /var/log/wtmp diretamente, a partir da posição salva na execução
+    anterior; se o arquivo não puder ser lido, recorre ao comando `last -F`.
+
+    Returns:
+        list: Lista de dicionários com usuário, tty, ip (host de origem), data
+        e hora de login (`datetime`) e de logout (`logout`, None se ainda logado).
+    """
+    checkpoint = load_state(WTMP_CHECKPOINT_FILE)
+    try:
+        checkpoint = read_wtmp_sessions(WTMP_FILE, checkpoint)
+    except (OSError, ValueError, struct.error) as e:
+        logging.warning(f"Could not read {WTMP_FILE} ({e}), falling back to 'last -F'")
+        return get_user_login_history_from_last()
+    save_state(WTMP_CHECKPOINT_FILE, checkpoint)
+    return list(checkpoint['sessions'].values())
+
+
+def utmp_string(raw):
+    """
+    Converte um campo de texto do utmp (terminado em NUL) para str.
+    """
+    return raw.split(b'\0', 1)[0].decode('utf-8', 'replace')
+
+
+def read_wtmp_sessions(path, checkpoint):
+    """
+    Processa os registros do wtmp adicionados desde o checkpoint.
+
+    O arquivo é mapeado em memória (mmap) e só os registros completos após
+    `offset` são lidos. Se o inode mudar (rotação) ou o arquivo encolher, a
+    leitura recomeça do início, preservando as sessões já conhecidas.
+
+    Args:
+        path (str): Caminho do wtmp.
+        checkpoint (dict): {'inode', 'offset', 'sessions': {usuário: sessão},
+            'open': {linha: usuário}} da execução anterior (ou {}).
+
+    Returns:
+        dict: O checkpoint atualizado.
+    """
+    stat = os.stat(path)
+    sessions = checkpoint.get('sessions', {})
+    open_sessions = checkpoint.get('open', {})
+    offset = checkpoint.get('offset', 0)
+    if checkpoint.get('inode') != stat.st_ino or offset > stat.st_size:
+        offset = 0
+
+    def close_session(line, timestamp):
+        session = sessions.get(open_sessions.pop(line, None))
+        if session and session['tty'] == line and session['logout'] is None:
+            session['logout'] = timestamp
+
+    count = (stat.st_size - offset) // UTMP_RECORD.size
+    if count:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for position in range(offset, offset + count * UTMP_RECORD.size, UTMP_RECORD.size):
+                record = UTMP_RECORD.unpack_from(data, position)
+                ut_type, line, user, host, seconds = record[0], record[3], record[5], record[6], record[10]
+                timestamp = datetime.fromtimestamp(seconds).strftime('%Y-%m-%d %H:%M:%S')
+                line = utmp_string(line)
+                if ut_type == UTMP_USER_PROCESS:
+                    user = utmp_string(user)
+                    sessions[user] = {'user': user, 'tty': line, 'ip': utmp_string(host),
+                                      'datetime': timestamp, 'logout': None}
+                    open_sessions[line] = user
+                elif ut_type == UTMP_DEAD_PROCESS:
+                    close_session(line, timestamp)
+                elif ut_type == UTMP_BOOT_TIME or (ut_type == UTMP_RUN_LVL and utmp_string(user) == 'shutdown'):
+                    # Desligamento ou reinício encerram todas as sessões abertas
+                    for open_line in list(open_sessions):
+                        close_session(open_line, timestamp)
+
+    return {
+        'inode': stat.st_ino,
+        'offset': offset + count * UTMP_RECORD.size,
+        'sessions': sessions,
+        'open': open_sessions,
+    }
+
+
+def get_user_login_history_from_last():
+    """
+    Obtém o histórico de logins a partir da saída do comando `last -F`.
+
     Returns:
         list: Lista de dicionários contendo informações sobre logins de usuários.
     """
@@ -111,6 +279,7 @@ def get_ip_and_mac_addresses():
     Returns:
         list: Lista de dicionários contendo informações sobre IP e MAC das interfaces.
     """
+    import psutil
     ip_and_mac = []
     for interface, addrs in psutil.net_if_addrs().items():
         ip = None
@@ -149,6 +318,7 @@ def get_memory_info():
     Returns:
         float: Memória total em GB.
     """
+    import psutil
     mem_info = psutil.virtual_memory()
     return round(mem_info.total / (1024**3), 2)
 
@@ -159,6 +329,7 @@ def get_disk_info():
     Returns:
         dict: Dicionário contendo a capacidade total e o espaço livre do disco em GB.
     """
+    import psutil
     disk_info = psutil.disk_usage('/')
     return {
         'total': round(disk_info.total / (1024**3), 2),
@@ -168,22 +339,62 @@ def get_disk_info():
 def get_mounted_filesystems():
     """
     Obtém informações sobre os sistemas de arquivos montados.
+
+    O uso de cada ponto de montagem é consultado em paralelo, com tempo
+    limitado; montagens que não respondem a tempo (por exemplo, NFS/CIFS
+    inacessíveis) são omitidas do resultado.
     
     Returns:
         list: Lista de dicionários contendo informações sobre os sistemas de arquivos montados.
     """
-    filesystems = []
+    import psutil
+
+    def check_usage(mountpoint, slot):
+        try:
+            slot['value'] = psutil.disk_usage(mountpoint)
+        except Exception as e:
+            slot['error'] = e
+
+    partitions = []
     for partition in psutil.disk_partitions():
-        if partition.fstype != 'squashfs':
-            usage = psutil.disk_usage(partition.mountpoint)
-            filesystems.append({
-                'device': partition.device,
-                'mountpoint': partition.mountpoint,
-                'fstype': partition.fstype,
-                'total': round(usage.total / (1024**3), 2),
-                'used': round(usage.used / (1024**3), 2),
-                'free': round(usage.free / (1024**3), 2)
-            })
+        if partition.fstype == 'squashfs':
+            continue
+        # No modo daemon, não acumula threads sobre uma montagem que continua travada
+        hung = HUNG_MOUNTS.get(partition.mountpoint)
+        if hung and hung.is_alive():
+            logging.warning(f"Skipping mount {partition.mountpoint}: previous check still hung")
+            continue
+        partitions.append(partition)
+    usages = []
+    threads = []
+    for partition in partitions:
+        slot = {}
+        # Threads daemon: uma montagem travada não impede o agente de terminar
+        thread = threading.Thread(target=check_usage, args=(partition.mountpoint, slot), daemon=True)
+        thread.start()
+        usages.append(slot)
+        threads.append(thread)
+    deadline = time.monotonic() + MOUNT_USAGE_TIMEOUT
+    for partition, thread in zip(partitions, threads):
+        thread.join(max(0, deadline - time.monotonic()))
+        if thread.is_alive():
+            HUNG_MOUNTS[partition.mountpoint] = thread
+        else:
+            HUNG_MOUNTS.pop(partition.mountpoint, None)
+
+    filesystems = []
+    for partition, usage in zip(partitions, usages):
+        if 'value' not in usage:
+            logging.warning(f"Skipping mount {partition.mountpoint}: {usage.get('error', 'disk_usage timed out')}")
+            continue
+        filesystems.append({
+            'device': partition.device,
+            'mountpoint': partition.mountpoint,
+            'fstype': partition.fstype,
+            'total': round(usage['value'].total / (1024**3), 2),
+            'used': round(usage['value'].used / (1024**3), 2),
+            'free': round(usage['value'].free / (1024**3), 2)
+        })
     return filesystems
 
 def get_gpu_info():
@@ -196,6 +407,7 @@ def get_gpu_info():
     gpu_info = []
     try:
         # Tenta obter informações sobre GPUs NVIDIA
+        import GPUtil
         gpus = GPUtil.getGPUs()
         for gpu in gpus:
             gpu_info.append({
@@ -246,29 +458,114 @@ def get_motherboard_model():
         logging.error(f"Error retrieving motherboard model: {e}")
         return 'Unknown'
 
-def collect_system_info():
+# Registro dos coletores: (seção do relatório, função, valor em caso de falha, tempo máximo em segundos).
+# Seções com valor None são omitidas do relatório quando o coletor falha ou
+# estoura o tempo, para que o servidor mantenha os dados já conhecidos.
+COLLECTORS = (
+    ('linux_distribution', get_linux_distribution, 'Unknown', 5),
+    ('kernel_version', get_kernel_version, 'Unknown', 2),
+    ('logged_in_user', get_logged_in_user, 'Unknown', 2),
+    ('cpu_model', lambda: get_cpu_info().get('model_name', 'Unknown'), 'Unknown', 2),
+    ('memory_total_gb', get_memory_info, 0.0, 2),
+    ('user_login_history', get_user_login_history, None, 10),
+    ('ip_and_mac_addresses', get_ip_and_mac_addresses, None, 5),
+    ('mounted_filesystems', get_mounted_filesystems, None, MOUNT_USAGE_TIMEOUT + 3),
+    ('disk_info', get_disk_info, None, MOUNT_USAGE_TIMEOUT),
+    ('gpu_info', get_gpu_info, None, 15),
+    ('motherboard_model', get_motherboard_model, 'Unknown', 2),
+)
+
+
+def run_collectors(collectors, time_budget=COLLECTION_TIME_BUDGET):
+    """
+    Executa os coletores em paralelo, cada um com seu tempo máximo e todos
+    dentro de um orçamento total de tempo.
+
+    Um coletor cuja execução anterior ainda está travada não é iniciado de
+    novo (modo daemon): a seção fica incompleta até a thread antiga retornar.
+
+    Args:
+        collectors (tuple): Coletores no formato de COLLECTORS.
+        time_budget (float): Tempo máximo total da coleta, em segundos.
+
+    Returns:
+        tuple: (dicionário seção -> valor, lista das seções incompletas).
+    """
+    started = time.monotonic()
+    running = []
+    results = {}
+    incomplete = []
+    for section, func, default, timeout in collectors:
+        hung = HUNG_COLLECTORS.get(section)
+        if hung and hung.is_alive():
+            logging.warning(f"Skipping collector {section}: previous run still hung")
+            incomplete.append(section)
+            if default is not None:
+                results[section] = default
+            continue
+        slot = {}
+
+        def target(func=func, slot=slot):
+            probe_started = time.monotonic()
+            try:
+                slot['value'] = func()
+            except Exception as e:
+                slot['error'] = e
+            slot['elapsed'] = time.monotonic() - probe_started
+
+        # Threads daemon: um coletor travado não impede o agente de terminar
+        thread = threading.Thread(target=target, name=f'collector-{section}', daemon=True)
+        thread.start()
+        running.append((section, default, timeout, thread, slot))
+
+    for section, default, timeout, thread, slot in running:
+        deadline = min(started + timeout, started + time_budget)
+        thread.join(max(0, deadline - time.monotonic()))
+        if thread.is_alive():
+            HUNG_COLLECTORS[section] = thread
+            logging.warning(f"Collector {section} timed out after {timeout}s")
+        elif 'error' in slot:
+            logging.error(f"Collector {section} failed in {slot['elapsed']:.2f}s: {slot['error']}")
+        else:
+            logging.info(f"Collector {section} finished in {slot['elapsed']:.2f}s")
+            results[section] = slot['value']
+            continue
+        incomplete.append(section)
+        if default is not None:
+            results[section] = default
+
+    logging.info(f"Collection finished in {time.monotonic() - started:.2f}s")
+    return results, incomplete
+
+
+def collect_system_info(static_cache=None):
     """
     Coleta todas as informações do sistema.
+
+    Args:
+        static_cache (dict): Se informado, guarda as seções de STATIC_SECTIONS
+            já coletadas, que não são coletadas de novo (modo daemon).
     
     Returns:
         dict: Dicionário contendo todas as informações coletadas sobre o sistema.
     """
+    if static_cache is None:
+        collectors = COLLECTORS
+    else:
+        collectors = tuple(collector for collector in COLLECTORS if collector[0] not in static_cache)
+    collected, incomplete = run_collectors(collectors)
+    if static_cache is not None:
+        static_cache.update({section: collected[section] for section in STATIC_SECTIONS
+                             if section in collected and section not in incomplete})
+        collected.update(static_cache)
     system_info = {
         'hostname': socket.gethostname(),
-        'linux_distribution': get_linux_distribution(),
-        'kernel_version': get_kernel_version(),
-        'logged_in_user': get_logged_in_user(),
-        'cpu_model': get_cpu_info().get('model_name', 'Unknown'),
-        'memory_total_gb': get_memory_info(),
         'uuid1': str(uuid.uuid1()),
         'collection_datetime': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'user_login_history': get_user_login_history(),
-        'ip_and_mac_addresses': get_ip_and_mac_addresses(),
-        'mounted_filesystems': get_mounted_filesystems(),
-        'disk_info': get_disk_info(),
-        'gpu_info': get_gpu_info(),
-        'motherboard_model': get_motherboard_model()
     }
+    system_info.update(collected)
+    if incomplete:
+        system_info['incomplete_sections'] = incomplete
     return system_info
 
 def save_json_to_disk(data):
@@ -282,25 +579,493 @@ def save_json_to_disk(data):
     with open(filename, 'w') as f:
         json.dump(data, f, indent=4)
 
-def send_system_info():
+def state_directory():
     """
-    Coleta as informações do sistema, salva em um arquivo JSON e envia para o servidor.
+    Retorna o diretório onde o agente guarda seu estado entre execuções.
+
+    Usa /var/lib/utf-inventory-agent quando há permissão de escrita (execução
+    como root); caso contrário, ~/.cache/utf-inventory-agent.
     """
-    system_info = collect_system_info()
-    #desabilitado para não salvar o arquivo no disco
-    #save_json_to_disk(system_info)
+    for directory in (STATE_DIRECTORY, os.path.expanduser('~/.cache/utf-inventory-agent')):
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError:
+            continue
+        if os.access(directory, os.W_OK):
+            return directory
+    return None
+
+
+def load_state(filename):
+    """
+    Carrega um arquivo JSON de estado do agente.
+
+    Returns:
+        dict: O conteúdo do arquivo, ou {} se ele não existir ou estiver corrompido.
+    """
+    directory = state_directory()
+    if not directory:
+        return {}
     try:
-        response = requests.post('http://apps.dacom:5000/api/upload', json=system_info)
-        logging.info(f"Status Code: {response.status_code}")
+        with open(os.path.join(directory, filename)) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def save_state(filename, state):
+    """
+    Grava um arquivo JSON de estado de forma atômica (arquivo temporário + rename).
+    """
+    directory = state_directory()
+    if not directory:
+        return
+    path = os.path.join(directory, filename)
+    try:
+        with open(path + '.tmp', 'w') as f:
+            json.dump(state, f)
+        os.replace(path + '.tmp', path)
+    except OSError as e:
+        logging.error(f"Could not save {filename}: {e}")
+
+
+def load_report_state():
+    """
+    Carrega os hashes do último relatório aceito pelo servidor.
+
+    Returns:
+        dict: {'report_hash': ..., 'sections': {seção: hash}} ou {} se não houver estado.
+    """
+    state = load_state(REPORT_STATE_FILE)
+    if not isinstance(state.get('sections'), dict):
+        return {}
+    return state
+
+
+def hash_value(value):
+    """
+    Calcula o sha256 da serialização canônica (chaves ordenadas) de um valor.
+    """
+    canonical = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def hash_sections(system_info):
+    """
+    Calcula o hash de cada seção do relatório, ignorando os campos que mudam
+    a cada coleta (uuid1, data da coleta e seções incompletas).
+    """
+    return {
+        section: hash_value(value)
+        for section, value in system_info.items()
+        if section not in VOLATILE_FIELDS
+    }
+
+
+def post_report(payload, headers=None):
+    """
+    Envia um relatório ao servidor e registra a resposta no log.
+
+    Returns:
+        requests.Response: a resposta, ou None se a requisição falhar.
+    """
+    return post_json(UPLOAD_URL, payload, headers)
+
+
+def payload_encodings(size):
+    """
+    Retorna as codificações a tentar, em ordem de preferência, para um corpo
+    de `size` bytes; 'identity' (sem compressão) é sempre a última.
+    """
+    if size < COMPRESSION_MIN_BYTES:
+        return ['identity']
+    encodings = []
+    if 'zstd' not in UNSUPPORTED_ENCODINGS and importlib.util.find_spec('zstandard'):
+        encodings.append('zstd')
+    if 'gzip' not in UNSUPPORTED_ENCODINGS:
+        encodings.append('gzip')
+    return encodings + ['identity']
+
+
+def compress_body(body, encoding):
+    """
+    Compacta o corpo de uma requisição com a codificação informada.
+    """
+    if encoding == 'zstd':
+        import zstandard
+        return zstandard.ZstdCompressor().compress(body)
+    if encoding == 'gzip':
+        return gzip.compress(body)
+    return body
+
+
+def post_json(url, payload, headers=None):
+    """
+    Envia um JSON ao servidor, compactado quando vale a pena, e registra a
+    resposta no log.
+
+    Se o servidor recusar o corpo compactado (415, ou 400 com a mensagem
+    INVALID_COMPRESSED_BODY), reenvia com a próxima codificação, até chegar
+    ao JSON puro. Qualquer outra resposta é devolvida como está.
+
+    Returns:
+        requests.Response: a resposta, ou None se a requisição falhar.
+    """
+    import requests
+    body = json.dumps(payload).encode('utf-8')
+    for encoding in payload_encodings(len(body)):
+        request_headers = dict(headers or {}, **{'Content-Type': 'application/json'})
+        if encoding != 'identity':
+            request_headers['Content-Encoding'] = encoding
+        data = compress_body(body, encoding)
+        try:
+            response = requests.post(url, data=data, headers=request_headers, timeout=REQUEST_TIMEOUT)
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Request failed: {e}")
+            return None
+        logging.info(f"Status Code: {response.status_code} ({encoding}, {len(data)} of {len(body)} bytes)")
         logging.info(f"Response Text: {response.text}")
+        if encoding != 'identity' and response.status_code == 415:
+            UNSUPPORTED_ENCODINGS.add(encoding)
+            logging.info(f"Server does not support {encoding}, retrying")
+            continue
+        if encoding != 'identity' and response.status_code == 400 and INVALID_COMPRESSED_BODY in response.text:
+            logging.info(f"Server could not decode {encoding} body, retrying")
+            continue
+        return response
+    return response
+
+
+def server_unavailable(response):
+    """
+    Indica se a falha no envio é transitória (rede, sobrecarga ou erro do
+    servidor) e o relatório deve ir para o spool.
+    """
+    return response is None or response.status_code == 429 or response.status_code >= 500
+
+
+@contextmanager
+def spool_lock(directory, blocking=True):
+    """
+    Trava exclusiva (flock) sobre o spool, para que execuções simultâneas do
+    agente (vários logins) não corrompam o arquivo.
+
+    Yields:
+        bool: True se a trava foi obtida (sempre, quando `blocking`).
+    """
+    with open(os.path.join(directory, SPOOL_LOCK_FILE), 'a') as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def read_spool(path):
+    """
+    Lê os relatórios do spool, descartando linhas truncadas ou corrompidas
+    (por exemplo, uma escrita interrompida por queda de energia).
+
+    Returns:
+        list: Relatórios (dicts) na ordem em que foram gravados.
+    """
+    reports = []
+    try:
+        with open(path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    logging.warning("Discarding truncated spool entry")
+                    continue
+                try:
+                    report = json.loads(line)
+                except ValueError:
+                    logging.warning("Discarding corrupt spool entry")
+                    continue
+                if isinstance(report, dict):
+                    reports.append(report)
+    except FileNotFoundError:
+        pass
+    return reports
+
+
+def write_spool(path, reports):
+    """
+    Regrava o spool com os relatórios informados, de forma atômica.
+    """
+    if not reports:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    with open(path + '.tmp', 'wb') as f:
+        for report in reports:
+            f.write(json.dumps(report).encode('utf-8') + b'\n')
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + '.tmp', path)
+
+
+def ends_with_newline(path):
+    """
+    Indica se o arquivo termina com uma quebra de linha.
+    """
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b'\n'
+
+
+def spool_report(directory, report):
+    """
+    Acrescenta um relatório ao spool (uma linha JSON, com fsync).
+
+    Se o arquivo passar de SPOOL_MAX_BYTES, os relatórios mais antigos são
+    descartados: o servidor só guarda o estado mais recente de cada máquina.
+    """
+    if not directory:
+        logging.error("No writable state directory, report discarded")
+        return
+    path = os.path.join(directory, SPOOL_FILE)
+    line = json.dumps(report).encode('utf-8') + b'\n'
+    with spool_lock(directory):
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size + len(line) > SPOOL_MAX_BYTES:
+            kept = []
+            total = len(line)
+            for entry in reversed(read_spool(path)):
+                entry_size = len(json.dumps(entry).encode('utf-8')) + 1
+                if total + entry_size > SPOOL_MAX_BYTES:
+                    break
+                kept.insert(0, entry)
+                total += entry_size
+            logging.warning("Spool size limit reached, dropping oldest reports")
+            write_spool(path, kept)
+            size = total - len(line)
+        with open(path, 'ab') as f:
+            # Uma escrita interrompida pode ter deixado a última linha sem '\n'
+            if size and not ends_with_newline(path):
+                f.write(b'\n')
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+    logging.info("Report saved to spool")
+
+
+def load_backoff(directory):
+    """
+    Retorna o estado de espera entre reenvios: {'failures': n, 'retry_at': timestamp}.
+    """
+    try:
+        with open(os.path.join(directory, SPOOL_BACKOFF_FILE)) as f:
+            backoff = json.load(f)
+    except (OSError, ValueError):
+        return {'failures': 0, 'retry_at': 0}
+    if not isinstance(backoff, dict):
+        return {'failures': 0, 'retry_at': 0}
+    return backoff
+
+
+def record_failure(directory):
+    """
+    Registra uma falha de envio e agenda a próxima tentativa.
+
+    A espera dobra a cada falha consecutiva (até BACKOFF_MAX) e é sorteada
+    entre zero e esse limite ("full jitter"), espalhando as reconexões das
+    máquinas depois de uma queda do servidor.
+    """
+    if not directory:
+        return
+    failures = load_backoff(directory).get('failures', 0) + 1
+    delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (failures - 1)))
+    logging.info(f"Server unavailable, next retry in {delay:.0f}s")
+    path = os.path.join(directory, SPOOL_BACKOFF_FILE)
+    with open(path + '.tmp', 'w') as f:
+        json.dump({'failures': failures, 'retry_at': time.time() + delay}, f)
+    os.replace(path + '.tmp', path)
+
+
+def clear_backoff(directory):
+    """
+    Zera o estado de espera após um envio bem-sucedido.
+    """
+    path = os.path.join(directory, SPOOL_BACKOFF_FILE)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def replay_spool(directory):
+    """
+    Reenvia os relatórios do spool para /api/upload/batch, em lotes de
+    SPOOL_BATCH_SIZE, removendo cada lote aceito. Depois de SPOOL_SPLIT_AFTER
+    falhas seguidas, o primeiro lote é reenviado um relatório por vez
+    (`replay_one_by_one`), para que um relatório ruim não trave o spool.
+
+    Returns:
+        bool: True se o spool está vazio (o servidor pode receber novos
+        envios); False se ainda há relatórios pendentes, seja porque o envio
+        falhou, porque o tempo de espera não terminou ou porque outro processo
+        está reenviando.
+    """
+    if not directory:
+        return True
+    path = os.path.join(directory, SPOOL_FILE)
+    if not os.path.exists(path):
+        return True
+    if load_backoff(directory).get('retry_at', 0) > time.time():
+        logging.info("Waiting for backoff before replaying spool")
+        return False
+    with spool_lock(directory, blocking=False) as locked:
+        if not locked:
+            return False
+        reports = read_spool(path)
+        split = load_backoff(directory).get('failures', 0) >= SPOOL_SPLIT_AFTER
+        while reports:
+            batch = reports[:SPOOL_BATCH_SIZE]
+            if split:
+                delivered = replay_one_by_one(batch)
+            else:
+                response = post_json(UPLOAD_BATCH_URL, batch)
+                delivered = not server_unavailable(response)
+                if delivered and not response.ok:
+                    # Lote rejeitado pelo servidor: reenviar não adiantaria
+                    logging.error(f"Spooled reports rejected with status {response.status_code}")
+            if not delivered:
+                write_spool(path, reports)
+                record_failure(directory)
+                return False
+            reports = reports[SPOOL_BATCH_SIZE:]
+            write_spool(path, reports)
+            # Houve progresso: as falhas seguintes já são de outro lote
+            clear_backoff(directory)
+            split = False
+        logging.info("Spool replayed")
+        clear_backoff(directory)
+    return True
+
+
+def replay_one_by_one(batch):
+    """
+    Reenvia um lote do spool um relatório por vez.
+
+    Se ao menos um relatório for aceito, o servidor está no ar e os que
+    falharam são descartados: são eles que travavam o spool. Se nenhum for
+    aceito, o servidor continua indisponível e o lote é mantido.
+
+    Returns:
+        bool: True se o lote pode ser removido do spool.
+    """
+    failed = []
+    for report in batch:
+        response = post_json(UPLOAD_BATCH_URL, [report])
+        if server_unavailable(response):
+            failed.append(report)
+        elif not response.ok:
+            logging.error(f"Spooled report rejected with status {response.status_code}")
+    if len(failed) == len(batch):
+        return False
+    for report in failed:
+        logging.error(f"Dropping spooled report from {report.get('collection_datetime')}: "
+                      "the server keeps failing on it")
+    return True
+
+
+def send_system_info(static_cache=None):
+    """
+    Coleta as informações do sistema e envia para o servidor.
+
+    Cada seção do relatório é resumida por um hash, guardado localmente após
+    um envio aceito. Se nada mudou desde o último envio, o agente manda apenas
+    um heartbeat (`If-None-Match`); se algo mudou, manda só as seções
+    alteradas (`If-Match` com o hash anterior). Quando o servidor não tem a
+    versão esperada (412), o relatório completo é reenviado.
+    """
+    system_info = collect_system_info(static_cache)
+    #desabilitado para não salvar o arquivo no disco
+    #save_json_to_disk(system_info)
+    state = load_report_state()
+    previous_sections = state.get('sections', {})
+    current_sections = hash_sections(system_info)
+    # Seções que falharam nesta coleta mantêm o hash (e o valor no servidor) anterior
+    sections = dict(previous_sections, **current_sections)
+    report_hash = hash_value(sections)
+
+    full_report = dict(system_info, report_hash=hash_value(current_sections))
+    directory = state_directory()
+    if not replay_spool(directory):
+        # Servidor indisponível há pouco: guarda o relatório em vez de insistir
+        spool_report(directory, full_report)
+        return
+
+    meta = {field: system_info[field] for field in ('hostname', 'uuid1', 'collection_datetime')}
+    base_hash = state.get('report_hash')
+    response = None
+    if report_hash == base_hash:
+        logging.info("No changes since last report, sending heartbeat")
+        payload = dict(meta, report_hash=report_hash)
+        response = post_report(payload, {'If-None-Match': f'"{report_hash}"'})
+    elif base_hash:
+        changed = [section for section, digest in current_sections.items()
+                   if previous_sections.get(section) != digest]
+        logging.info(f"Sending changed sections: {', '.join(changed)}")
+        payload = dict(meta, delta=True, report_hash=report_hash)
+        payload.update({section: system_info[section] for section in changed})
+        if 'incomplete_sections' in system_info:
+            payload['incomplete_sections'] = system_info['incomplete_sections']
+        response = post_report(payload, {'If-Match': f'"{base_hash}"'})
+
+    if response is not None and response.status_code == 412:
+        logging.info("Server requires the full report")
+        base_hash = None
+    if not base_hash:
+        # Sem estado anterior, ou o servidor não conhece a versão base: envia tudo
+        sections = current_sections
+        report_hash = full_report['report_hash']
+        response = post_report(full_report)
+
+    if server_unavailable(response):
+        spool_report(directory, full_report)
+        record_failure(directory)
+    elif response.ok or response.status_code == 304:
+        save_state(REPORT_STATE_FILE, {'report_hash': report_hash, 'sections': sections})
+
+def run_daemon(interval=DAEMON_INTERVAL, splay=DAEMON_SPLAY):
+    """
+    Mantém o agente residente, coletando e enviando o relatório a cada
+    `interval` segundos, mais um atraso aleatório de até `splay` segundos.
+
+    As seções estáticas são coletadas uma vez só; os envios sem mudanças
+    viram heartbeats baratos para o servidor.
+    """
+    static_cache = {}
+    logging.info(f"Starting daemon mode (interval {interval}s, splay {splay}s)")
+    # Espalha o primeiro envio: as máquinas ligam todas juntas no início da aula
+    time.sleep(random.uniform(0, splay))
+    while True:
+        started = time.monotonic()
         try:
-            logging.info(response.json())
-        except ValueError:
-            logging.error("Error decoding JSON response")
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Request failed: {e}")
+            send_system_info(static_cache)
+        except Exception as e:
+            logging.exception(f"Collection cycle failed: {e}")
+        elapsed = time.monotonic() - started
+        time.sleep(max(0, interval - elapsed) + random.uniform(0, splay))
+
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Agente de inventário do DACOM')
+    parser.add_argument('--daemon', action='store_true',
+                        help='executa continuamente, enviando o relatório periodicamente')
+    parser.add_argument('--interval', type=int, default=DAEMON_INTERVAL,
+                        help='intervalo entre coletas no modo daemon, em segundos')
+    parser.add_argument('--splay', type=int, default=DAEMON_SPLAY,
+                        help='atraso aleatório máximo somado a cada intervalo, em segundos')
+    args = parser.parse_args()
+
     # Instala as bibliotecas necessárias
     install_packages()
-    send_system_info()
+    if args.daemon:
+        run_daemon(args.interval, args.splay)
+    else:
+        send_system_info()